@@ -1,7 +1,6 @@
 import datetime
 import operator
 import os
-from functools import partial
 from io import BytesIO
 from typing import Any, Iterator, Optional, Sequence, Set, Tuple, Union, cast
 
@@ -50,7 +49,7 @@ class HikariObjects:
             for hikari_obj in (
                 await app.loop.run_in_executor(
                     app.executor,
-                    partial(Inventory, url=f"{HIKARI_BASE_URL}/objects.inv"),
+                    lambda: Inventory(url=f"{HIKARI_BASE_URL}/objects.inv"),
                 )
             ).objects
         }
@@ -163,8 +162,8 @@ if HAS_SPOTIFY_VARS:
         audio_features = await spotify_track.get_audio_features()
 
         album_byte = await spotify_client.get_album(spotify_track.album_cover_url)
-        colors = spotify_client.get_colors(
-            BytesIO(album_byte), "top-bottom blur", spotify_track.album_cover_url
+        colors = await spotify_client.get_album_colors(
+            spotify_track.album_cover_url, "top-bottom blur"
         )
         spotify_code_url = spotify_track.get_code_url(hikari.Color.from_rgb(*colors[0]))
         spotify_code = await spotify_client.get_spotify_code(spotify_code_url)
@@ -234,8 +233,10 @@ if HAS_SPOTIFY_VARS:
         cover: Optional[bytes]
         if spotify_artist.cover_url:
             cover = await spotify_client.get_album(spotify_artist.cover_url)
-            colors = spotify_client.get_colors(
-                BytesIO(cover), "top-bottom blur", spotify_artist.cover_url
+            colors = (
+                await spotify_client.get_album_colors(
+                    spotify_artist.cover_url, "top-bottom blur"
+                )
             )[0]
         else:
             cover = None
@@ -315,8 +316,10 @@ if HAS_SPOTIFY_VARS:
             return
 
         cover = await spotify_client.get_album(spotify_album.cover_url)
-        colors = spotify_client.get_colors(
-            BytesIO(cover), "top-bottom blur", spotify_album.cover_url
+        colors = (
+            await spotify_client.get_album_colors(
+                spotify_album.cover_url, "top-bottom blur"
+            )
         )[0]
 
         spotify_code_url = spotify_album.get_code_url(hikari.Color.from_rgb(*colors))
@@ -493,7 +496,9 @@ def rtfd_hikari(
 @initializer
 def extension_initializer(handler: GatewayCommandHandler) -> None:
     if HAS_SPOTIFY_VARS:
-        handler.set_data(SpotifyClient(cast(Nokari, handler.app)), suppress=True)
+        spotify_client = SpotifyClient(cast(Nokari, handler.app))
+        handler.set_data(spotify_client, suppress=True)
+        spotify_client.create_task(spotify_client.warm_up())
 
     handler.set_data(HikariObjects(), suppress=True)
 
@@ -501,3 +506,6 @@ def extension_initializer(handler: GatewayCommandHandler) -> None:
 @finalizer
 def extension_finalizer(handler: GatewayCommandHandler) -> None:
     del handler._data[HikariObjects]
+
+    if spotify_client := handler._data.pop(SpotifyClient, None):
+        spotify_client.create_task(spotify_client.close())
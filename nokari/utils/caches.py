@@ -3,12 +3,13 @@ A module that contains cache decorator implementations.
 Based on Danny a.k.a Rapptz's implementation.
 """
 import asyncio
+import time
 import typing
 from functools import wraps
 
 from lru import LRU  # pylint: disable=no-name-in-module
 
-__all__: typing.Final[typing.List[str]] = ["cache"]
+__all__: typing.Final[typing.List[str]] = ["cache", "coalesce"]
 _FuncT = typing.TypeVar("_FuncT", bound=typing.Callable[..., typing.Any])
 
 
@@ -23,15 +24,102 @@ def _get_key(args: typing.Tuple[typing.Any, ...]) -> str:
     return ":".join(_get_repr(obj) for obj in args)
 
 
-def cache(size: int) -> typing.Callable[[_FuncT], _FuncT]:
+def coalesce(func: _FuncT) -> _FuncT:
+    """
+    Makes concurrent calls to the decorated coroutine function
+    with the same arguments share a single underlying call.
+    """
+    _pending: typing.Dict[str, asyncio.Future] = {}
+
+    @wraps(func)
+    async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        key = _get_key((*args, *kwargs.items()))
+
+        try:
+            fut = _pending[key]
+        except KeyError:
+            fut = _pending[key] = asyncio.ensure_future(func(*args, **kwargs))
+            fut.add_done_callback(lambda _: _pending.pop(key, None))
+
+        # shielded so a cancelled caller doesn't cancel the others.
+        return await asyncio.shield(fut)
+
+    return typing.cast(_FuncT, wrapper)
+
+
+def cache(
+    size: int,
+    ttl: typing.Optional[float] = None,
+    max_bytes: typing.Optional[int] = None,
+) -> typing.Callable[[_FuncT], _FuncT]:
+    """
+    Caches the return values of the decorated function in an LRU of the given size.
+    If ttl is passed, entries that are older than ttl seconds are treated as misses.
+    The ttl can be changed later on through the wrapper's ttl attribute.
+    If max_bytes is passed, the return values must be sized, e.g. bytes,
+    and the least recently used ones are evicted once their total exceeds it.
+    """
+
     def decorator(func: _FuncT) -> _FuncT:
         _is_static_method = isinstance(func, staticmethod)
 
         if _is_static_method:
             func = func.__get__(decorator)  # type: ignore
 
-        _is_coro = asyncio.iscoroutinefunction(func)
+        if _is_coro := asyncio.iscoroutinefunction(func):
+            func = coalesce(func)
+
         _cache = LRU(size)
+        last_sweep = time.monotonic()
+        total_bytes = 0
+
+        def del_entry(key: str) -> None:
+            nonlocal total_bytes
+
+            if max_bytes is not None:
+                total_bytes -= len(_cache[key][0])
+
+            del _cache[key]
+
+        def get_entry(key: str) -> typing.Any:
+            res, inserted_at = _cache[key]
+            if (ttl := wrapper.ttl) is not None and (  # type: ignore
+                time.monotonic() - inserted_at > ttl
+            ):
+                del_entry(key)
+                raise KeyError(key)
+
+            return res
+
+        def set_entry(key: str, value: typing.Any) -> typing.Any:
+            nonlocal last_sweep, total_bytes
+
+            now = time.monotonic()
+            if (ttl := wrapper.ttl) is not None and now - last_sweep > ttl:  # type: ignore
+                # drop the expired entries every now and then
+                # so they don't linger until they get evicted.
+                last_sweep = now
+                for k, (_, inserted_at) in _cache.items():
+                    if now - inserted_at > ttl:
+                        del_entry(k)
+
+            if max_bytes is not None:
+                if key in _cache:
+                    del_entry(key)
+
+                # evict by hand rather than letting the LRU do it,
+                # so the running total stays in sync with what's cached.
+                while _cache and (
+                    len(_cache) >= size or total_bytes + len(value) > max_bytes
+                ):
+                    item = _cache.peek_last_item()
+                    assert item is not None
+                    del_entry(item[0])
+
+                total_bytes += len(value)
+
+            _cache[key] = (value, now)
+            return value
 
         @wraps(func)
         def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
@@ -40,19 +128,18 @@ def cache(size: int) -> typing.Callable[[_FuncT], _FuncT]:
                 args = args[1:]
 
             try:
-                res = _cache[key]
+                res = get_entry(key)
             except KeyError:
                 temp = func(*args, **kwargs)
 
                 if _is_coro:
 
                     async def wrapper() -> typing.Coroutine:
-                        res = _cache[key] = await temp
-                        return res
+                        return set_entry(key, await temp)
 
                     return wrapper()
 
-                res = _cache[key] = temp
+                res = set_entry(key, temp)
             else:
                 if _is_coro:
                     return asyncio.sleep(0, res)
@@ -60,6 +147,7 @@ def cache(size: int) -> typing.Callable[[_FuncT], _FuncT]:
             return res
 
         wrapper.cache = _cache  # type: ignore
+        wrapper.ttl = ttl  # type: ignore
         return typing.cast(_FuncT, wrapper)
 
     return decorator
@@ -138,13 +138,22 @@ def human_timedelta(
     return " ".join(output) + suffix
 
 
-def get_timestamp(timedelta: datetime.timedelta) -> str:
-    """Gets the timestamp string of a timedelta object."""
-    out = re.sub(" days?, ", ":", str(timedelta)).split(":")
-    out = ":".join(f"{int(float(x)):02d}" for x in out)
-    while out.startswith("00:") and len(out) > 5:
-        out = out[3:]
-    return re.sub(r"^0(\d:)", r"\1", out)
+def get_timestamp(timedelta: datetime.timedelta | float) -> str:
+    """Gets the timestamp string of a timedelta object or an amount of seconds."""
+    if isinstance(timedelta, datetime.timedelta):
+        timedelta = timedelta.total_seconds()
+
+    minutes, seconds = divmod(int(timedelta), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+
+    if days:
+        return f"{days}:{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+    return f"{minutes}:{seconds:02d}"
 
 
 def escape_markdown(text: str) -> str:
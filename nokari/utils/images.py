@@ -1,7 +1,7 @@
 """A module that contains helper function for image generating purpose."""
 
-from functools import cache  # type: ignore
-from typing import Final, List, Tuple, cast
+from functools import cache, lru_cache  # type: ignore
+from typing import Final, List, Tuple, Union, cast
 
 import numexpr
 import numpy
@@ -13,6 +13,7 @@ __all__: Final[List[str]] = [
     "round_corners",
     "get_dominant_color",
     "right_fade",
+    "get_fade_mask",
 ]
 
 
@@ -51,9 +52,9 @@ def round_corners(im: Image.Image, rad: int) -> None:
     im.putalpha(_get_alpha_mask(im.size, rad))
 
 
-def get_dominant_color(im: Image.Image) -> Tuple[int, ...]:
-    """Gets the color with the most occurences."""
-    arr = numpy.array(im)
+def get_dominant_color(im: Union[Image.Image, numpy.ndarray]) -> Tuple[int, ...]:
+    """Gets the color with the most occurences, takes either an image or its array."""
+    arr = numpy.asarray(im)
     a2D = arr.reshape(-1, arr.shape[-1])
 
     if a2D.shape[-1] == 4:
@@ -75,12 +76,13 @@ def get_dominant_color(im: Image.Image) -> Tuple[int, ...]:
     )
 
 
-def right_fade(im: Image.Image, rad: int = 100) -> Image.Image:
-    """Returns the right-faded image."""
-
-    im = im.convert("RGBA")
-    w, h = im.size
-
+@lru_cache(maxsize=32)
+def get_fade_mask(size: Tuple[int, int], rad: int) -> Image.Image:
+    """
+    Gets the fade mask, it only depends on the size and the radius.
+    The image is cached and shared, thus it mustn't be mutated.
+    """
+    w, h = size
     mask = Image.new("L", (w + rad, h + rad), 255)
     m_w, m_h = mask.size
     drawmask = ImageDraw.Draw(mask)
@@ -89,14 +91,19 @@ def right_fade(im: Image.Image, rad: int = 100) -> Image.Image:
         fill=0,
     )
 
-    im.putalpha(
-        mask.filter(ImageFilter.GaussianBlur(radius=rad)).crop(
-            box=(
-                rad // 2,
-                rad // 2,
-                m_w - rad // 2,
-                m_h - rad // 2,
-            )
+    return mask.filter(ImageFilter.GaussianBlur(radius=rad)).crop(
+        box=(
+            rad // 2,
+            rad // 2,
+            m_w - rad // 2,
+            m_h - rad // 2,
         )
     )
+
+
+def right_fade(im: Image.Image, rad: int = 100) -> Image.Image:
+    """Returns the right-faded image."""
+
+    im = im.convert("RGBA")
+    im.putalpha(get_fade_mask(im.size, rad))
     return im
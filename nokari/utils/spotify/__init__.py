@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import asyncio
-import datetime
+import logging
+import os
 import re
+import string
 import textwrap
 import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
-from functools import partial
 from io import BytesIO
+from operator import attrgetter
 
 import hikari
 import numpy
-from colorthief import ColorThief
+from lru import LRU  # pylint: disable=no-name-in-module
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
 from kita.utils import find
@@ -21,13 +24,13 @@ from nokari.utils.algorithm import get_alt_color, get_luminance
 from nokari.utils.formatter import get_timestamp as format_time
 from nokari.utils.images import (
     get_dominant_color,
+    get_fade_mask,
     has_transparency,
-    right_fade,
     round_corners,
 )
 
 from .cache import SpotifyCache
-from .errors import LocalFilesDetected, NoSpotifyPresenceError
+from .errors import LocalFilesDetected, NoSpotifyPresenceError, SpotifyRestError
 from .rest import SpotifyRest
 from .typings import Artist  # re-export
 from .typings import (
@@ -44,15 +47,68 @@ if typing.TYPE_CHECKING:
     from nokari.core import Context
     from nokari.core.bot import Nokari
 
-    from .typings import T
+    from .typings import SimplifiedTrack, T
 
 _RGBs = typing.List[_RGB]
+_LOGGER = logging.getLogger("nokari.utils.spotify")
+# same coefficients as algorithm.get_luminance.
+_LUMINANCE_WEIGHTS = numpy.array((0.2126, 0.7152, 0.0722))
 PI_RAD: int = 180
 
 
 SPOTIFY_URL = re.compile(
     r"(?:https?://)?open.spotify.com/(?:track|album|artist|playlist)/(?P<id>\w+)"
 )
+_match_spotify_url = SPOTIFY_URL.match
+SPOTIFY_URI = re.compile(r"spotify:(?:track|album|artist|playlist):(?P<id>\w+)$")
+_match_spotify_uri = SPOTIFY_URI.match
+
+# item types that can be looked up with a single multi-get request,
+# mapped to the rest method and the maximum amount of IDs per request.
+_BATCHED_LOOKUPS: typing.Dict[str, typing.Tuple[str, int]] = {
+    "track": ("tracks", 50),
+    "artist": ("artists", 50),
+    "audio_features": ("audio_features", 100),
+}
+
+
+def _log_task_exception(task: asyncio.Task[typing.Any]) -> None:
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        _LOGGER.warning("Background task failed", exc_info=exc)
+
+
+@caches.cache(8)
+def _compile_format(template: str) -> typing.Callable[[typing.Any], str]:
+    """Parses an `{item.attr}` style template once and returns
+    a function that renders it for the given item.
+    """
+    parts: typing.List[
+        typing.Tuple[
+            str, typing.Optional[typing.Callable[[typing.Any], typing.Any]], str
+        ]
+    ] = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if field is None:
+            parts.append((literal, None, ""))
+            continue
+
+        if conversion:
+            raise ValueError("Conversions aren't supported in item templates.")
+
+        name, _, attr = field.partition(".")
+        if name != "item":
+            raise ValueError(f"Unknown field {field!r} in item template.")
+
+        getter = attrgetter(attr) if attr else None
+        parts.append((literal, getter or (lambda item: item), spec or ""))
+
+    def render(item: typing.Any) -> str:
+        return "".join(
+            literal if getter is None else literal + format(getter(item), spec)
+            for literal, getter, spec in parts
+        )
+
+    return render
 
 
 class SpotifyClient:
@@ -66,13 +122,98 @@ class SpotifyClient:
     C2_BOLD_FONT = ImageFont.truetype(
         "nokari/assets/fonts/Arial-Unicode-Bold.ttf", size=60
     )
+    # only the shape matters, the color gets pasted through it.
+    SPOTIFY_LOGO_MASK = Image.open("nokari/assets/media/Spotify-50px.png").getchannel(
+        "A"
+    )
     SIDE_GAP = 50
     WIDTH = 1_280
 
+    # glyph -> (width, height, top offset, height) per font, shared by every card.
+    _glyph_metrics: typing.ClassVar[typing.Dict[ImageFont.FreeTypeFont, LRU]] = {}
+
+    # (font path, font size, text) -> "L" mask of the static text on the cards.
+    # keyed by hand since fonts don't have a repr caches.cache could key them by.
+    _text_masks: typing.ClassVar[LRU] = LRU(8)
+    # (font path, font size, text, threshold) -> shortened text, same deal.
+    text_cache: typing.ClassVar[LRU] = LRU(100)
+
+    # the loop only keeps weak references to tasks, so hold on to the
+    # fire-and-forget ones here until they're done, e.g. the close on reload.
+    _background_tasks: typing.ClassVar[typing.Set[asyncio.Task[typing.Any]]] = set()
+
+    # shared so reloading the extension doesn't start over with a cold cache.
+    _shared_cache: typing.ClassVar[typing.Optional[SpotifyCache]] = None
+
     def __init__(self, bot: Nokari) -> None:
         self.bot = bot
-        self.cache = SpotifyCache()
+        self.cache = self._get_shared_cache()
         self.rest = SpotifyRest()
+        # card rendering gets its own threads so it doesn't queue behind
+        # (or starve) everything else that runs in the bot's executor.
+        # PIL releases the GIL in its C loops, so one thread per core scales.
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(os.cpu_count() or 1, 2), thread_name_prefix="spotify"
+        )
+        self._pending_lookups: typing.Dict[
+            str, typing.Dict[str, asyncio.Future[typing.Dict[str, typing.Any]]]
+        ] = {}
+
+    async def close(self) -> None:
+        await self.rest.close()
+        # the cache outlives this client, only stop its clear loop
+        # so the next one can pick it back up along with the items.
+        await self.cache.close()
+        self.executor.shutdown(wait=False)
+
+    @classmethod
+    def create_task(
+        cls, coro: typing.Coroutine[typing.Any, typing.Any, typing.Any]
+    ) -> asyncio.Task[typing.Any]:
+        """Runs the coroutine in the background and logs it if it fails."""
+        task = asyncio.create_task(coro)
+        cls._background_tasks.add(task)
+        task.add_done_callback(cls._background_tasks.discard)
+        task.add_done_callback(_log_task_exception)
+        return task
+
+    async def warm_up(self) -> None:
+        """Pays the one-time costs up front so the first card doesn't have to,
+        i.e. the glyph metrics, the codecs, and the connection to Spotify.
+        """
+
+        def render() -> None:
+            for font in (
+                self.SMALL_FONT,
+                self.BIG_FONT,
+                self.C1_BOLD_FONT,
+                self.C2_BOLD_FONT,
+            ):
+                self._get_metrics_map(string.ascii_letters + string.digits, font)
+
+            cover = BytesIO()
+            Image.new("RGB", (64, 64), (30, 215, 96)).save(cover, "JPEG")
+            self._get_dom_color(cover, "top-bottom blur")
+            self._get_palette(cover)
+            Image.new("RGBA", (64, 64)).save(BytesIO(), "PNG", compress_level=1)
+
+        try:
+            await asyncio.gather(
+                self.bot.loop.run_in_executor(self.executor, render),
+                self.rest.warm_up(),
+            )
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to warm up the Spotify client", exc_info=True)
+
+    @classmethod
+    def _get_shared_cache(cls) -> SpotifyCache:
+        if (cache := cls._shared_cache) is None:
+            cache = cls._shared_cache = SpotifyCache()
+
+        # the clear loop is stopped once every client has closed or when
+        # its loop is gone, this restarts it without throwing the items away.
+        cache.start()
+        return cache
 
     @staticmethod
     def _get_timestamp(spotify: Spotify) -> typing.Tuple[str, str, float]:
@@ -87,33 +228,35 @@ class SpotifyClient:
                 "Missing timestamps, the object might not be a Spotify object."
             )
 
-        elapsed = datetime.datetime.now(tz=datetime.timezone.utc) - timestamps.start
-        duration = timestamps.end - timestamps.start
+        # work with plain floats, the formatter takes seconds as well.
+        start = timestamps.start.timestamp()
+        elapsed = time.time() - start
+        duration = timestamps.end.timestamp() - start
 
-        prog = min(
-            max(elapsed.total_seconds() / duration.total_seconds() * 100, 0), 100
-        )
+        prog = min(max(elapsed / duration * 100, 0), 100)
 
         dur: str = format_time(duration)
         pos: str = (
-            dur
-            if prog == 100
-            else format_time(elapsed)
-            if elapsed.total_seconds() > 0
-            else "0:00"
+            dur if prog == 100 else format_time(elapsed) if elapsed > 0 else "0:00"
         )
 
         return pos, dur, prog
 
+    @caches.cache(32)
     @staticmethod
-    def _generate_rounded_rectangle(
-        size: typing.Tuple[int, int], rad: int, fill: _RGB
+    def _generate_bar_mask(
+        size: typing.Tuple[int, int], rad: int, opacity: int
     ) -> Image.Image:
-        """Generates a rounded rectangle image."""
-        base = Image.new("RGBA", size, fill)
-        corner = Image.new("RGBA", (rad,) * 2, (0,) * 4)
+        """
+        Generates the "L" mask of a rounded rectangle with the given opacity.
+        The image is cached and shared, thus it mustn't be mutated.
+        """
+        base = Image.new("L", size, opacity)
+        corner = Image.new("L", (rad,) * 2, 0)
         draw = ImageDraw.Draw(corner)
-        draw.pieslice([*(0,) * 2, *(rad * 2,) * 2], PI_RAD, PI_RAD * 3 / 2, fill=fill)
+        draw.pieslice(
+            [*(0,) * 2, *(rad * 2,) * 2], PI_RAD, PI_RAD * 3 / 2, fill=opacity
+        )
 
         for i, coord in enumerate(
             zip([*(0,) * 2, *(size[0] - rad,) * 2], [0, *(size[1] - rad,) * 2, 0])
@@ -122,98 +265,153 @@ class SpotifyClient:
 
         return base
 
-    @caches.cache(20)
-    async def get_album(self, album_url: str) -> bytes:
-        if self.bot.session is None:
-            raise RuntimeError("Missing ClientSession...")
+    @staticmethod
+    def _get_text_mask(text: str, font: ImageFont.FreeTypeFont) -> Image.Image:
+        """
+        Renders static text into an "L" mask, so it can be pasted in any color
+        without going through FreeType again.
+        The image is cached and shared, thus it mustn't be mutated.
+        """
+        key = (font.path, font.size, text)
+        if (mask := SpotifyClient._text_masks.get(key)) is None:
+            mask = Image.new("L", font.getbbox(text)[2:])
+            ImageDraw.Draw(mask).text((0, 0), text, font=font, fill=255)
+            SpotifyClient._text_masks[key] = mask
+
+        return mask
 
-        async with self.bot.session.get(album_url) as r:
+    # covers vary a lot in size, so bound the cache by bytes as well.
+    @caches.cache(64, ttl=3600, max_bytes=64 * 1024 * 1024)
+    async def get_album(self, album_url: str) -> bytes:
+        # the rest session keeps connections to Spotify's CDN alive.
+        async with self.rest.session.get(album_url) as r:
             return await r.read()
 
-    @caches.cache(20)
+    @caches.cache(20, ttl=3600)
     async def get_spotify_code(self, spotify_code_url: str) -> bytes:
         """
         Duplicates of _get_album as it isn't supposed to share the cache
         """
-        if self.bot.session is None:
-            raise RuntimeError("Missing ClientSession...")
-
-        async with self.bot.session.get(spotify_code_url) as r:
+        async with self.rest.session.get(spotify_code_url) as r:
             return await r.read()
 
     async def _get_album_and_colors(
         self, album_url: str, height: int, mode: str
     ) -> typing.Tuple[typing.Tuple[_RGB, _RGBs], Image.Image]:
-        album = BytesIO(await self.get_album(album_url))
-        colors = await self.bot.loop.run_in_executor(
-            self.bot.executor, self.get_colors, album, mode, album_url
+        album = await self.get_album(album_url)
+        # BytesIO isn't thread-safe, hence separate buffers over the same bytes.
+        return await asyncio.gather(
+            self.get_album_colors(album_url, mode),
+            self.bot.loop.run_in_executor(
+                self.executor, self._get_album_image, BytesIO(album), height
+            ),
         )
-        return colors, Image.open(album).convert("RGBA").resize((height,) * 2)
+
+    @staticmethod
+    def _get_album_image(album: BytesIO, height: int) -> Image.Image:
+        im = Image.open(album)
+        # let libjpeg decode at a reduced scale when the cover is larger than needed.
+        im.draft("RGB", (height,) * 2)
+        return im.convert("RGBA").resize((height,) * 2)
 
     @caches.cache(20)
+    async def get_album_colors(
+        self, album_url: str, mode: str = "full"
+    ) -> typing.Tuple[_RGB, _RGBs]:
+        """Returns the dominant color as well as other colors present in the album,
+        they're extracted in parallel off the loop.
+        """
+        album = await self.get_album(album_url)
+        loop = self.bot.loop
+        dom_color, palette = await asyncio.gather(
+            loop.run_in_executor(
+                self.executor, self._get_dom_color, BytesIO(album), mode
+            ),
+            loop.run_in_executor(self.executor, self._get_palette, BytesIO(album)),
+        )
+        return self._merge_colors(dom_color, palette)
+
     @staticmethod
-    def get_colors(
-        image: BytesIO,
-        mode: str = "full",
-        image_url: str = "",  # necessary for caching
+    def _merge_colors(
+        dom_color: typing.Optional[_RGB], palette: _RGBs
     ) -> typing.Tuple[_RGB, _RGBs]:
-        """Returns the dominant color as well as other colors present in the image."""
-
-        def get_palette() -> _RGBs:
-            color_thief = ColorThief(image)
-            palette = color_thief.get_palette(color_count=5, quality=100)
-            return palette
-
-        def get_dom_color() -> typing.Optional[_RGB]:
-            im = Image.open(image)
-            use_mask = has_transparency(im)
-
-            if mode == "colorthief":
-                return None
-
-            im.thumbnail((400,) * 2)
-            w, h = im.size
-
-            if "crop" in mode:
-                im = im.crop((0, 0, w, h / 6))
-
-            elif "downscale" in mode:
-                im = im.resize((int(w / 2), int(h / 2)), resample=0)
-
-            elif "left-right" in mode:
-                div = w // 6
-                back_im = Image.new("RGBA", (div * 2, h), 0)
-                left = im.crop((0, 0, div, h))
-                right = im.crop((w - div, 0, w, h))
-                back_im.paste(left, (0, 0), use_mask and left)
-                back_im.paste(right, (div, 0), use_mask and right)
-                im = back_im
-
-            elif "top-bottom" in mode:
-                div = h // 6
-                back_im = Image.new("RGBA", (w, div * 2), 0)
-                top = im.crop((0, 0, w, div))
-                bot = im.crop((0, h - div, w, h))
-                back_im.paste(top, (0, 0), use_mask and top)
-                back_im.paste(bot, (0, div), use_mask and bot)
-                im = back_im
-
-            if "blur" in mode:
-                im = im.filter(ImageFilter.GaussianBlur(2))
-
-            dom_color = get_dominant_color(im)
-            im.close()
-            return dom_color
-
-        dom_color, palette = get_dom_color(), get_palette()
         if dom_color is None:
             dom_color = palette.pop(0)
 
         return dom_color, palette
 
+    @staticmethod
+    def _get_palette(image: BytesIO) -> _RGBs:
+        im = Image.open(image)
+        im.thumbnail((100,) * 2, Image.BOX)
+        pixels = numpy.asarray(im.convert("RGBA")).reshape(-1, 4)
+        im.close()
+
+        # skip the (mostly) transparent and the near-white pixels.
+        valid = (pixels[:, 3] >= 125) & ~(pixels[:, :3] > 250).all(axis=1)
+        if valid.any():
+            pixels = pixels[valid]
+
+        # Pillow's octree quantizer keeps distinct colors apart far better
+        # than its median cut, which tends to split the biggest cluster.
+        quantized = Image.fromarray(
+            numpy.ascontiguousarray(pixels[None, :, :3])
+        ).quantize(colors=5, method=Image.FASTOCTREE)
+        counts = numpy.bincount(numpy.asarray(quantized).ravel())
+        flat_palette = quantized.getpalette()
+        return [
+            tuple(flat_palette[idx * 3 : idx * 3 + 3])
+            for idx in numpy.argsort(-counts, kind="stable")
+            if counts[idx]
+        ]
+
+    @staticmethod
+    def _get_dom_color(image: BytesIO, mode: str) -> typing.Optional[_RGB]:
+        if mode == "colorthief":
+            return None
+
+        # Image.open is lazy and has_transparency only looks at
+        # the mode and info, so nothing gets decoded up until here.
+        im = Image.open(image)
+        use_mask = has_transparency(im)
+
+        # only the color statistics matter here, a box filter is plenty.
+        im.thumbnail((400,) * 2, Image.BOX)
+
+        if "crop" not in mode and "downscale" in mode:
+            im = im.reduce(2)
+
+        # decode once, the crops below are just slices of the array.
+        arr = numpy.asarray(im.convert("RGBA" if use_mask else "RGB"))
+        im.close()
+        h, w = arr.shape[:2]
+
+        # the modes are exclusive, in the same order of precedence as before.
+        if "crop" in mode:
+            arr = arr[: round(h / 6)]
+
+        elif "downscale" in mode:
+            # it's been reduced before decoding, the whole cover is sampled.
+            pass
+
+        elif "left-right" in mode:
+            div = w // 6
+            arr = numpy.concatenate((arr[:, :div], arr[:, w - div :]), axis=1)
+
+        elif "top-bottom" in mode:
+            div = h // 6
+            arr = numpy.concatenate((arr[:div], arr[h - div :]))
+
+        # the blur only smooths out noise before counting the colors,
+        # a single box pass does the job and tiny images don't need it.
+        if "blur" in mode and max(arr.shape[:2]) > 50:
+            arr = numpy.asarray(Image.fromarray(arr).filter(ImageFilter.BoxBlur(2)))
+
+        return get_dominant_color(arr)
+
     code_cache = get_spotify_code.cache  # type: ignore
     album_cache = get_album.cache  # type: ignore
-    color_cache = get_colors.cache  # type: ignore
+    color_cache = get_album_colors.cache  # type: ignore
 
     @typing.overload
     @staticmethod
@@ -247,14 +445,32 @@ class SpotifyClient:
         typing.Dict[str, typing.Tuple[int, int]],
         typing.Dict[str, typing.Tuple[int, int, int, int]],
     ]:
-        return {
-            char: (*size, size[1] - height, size[1])
-            if with_vertical_metrics
-            and (height := font.getmask(char).size[1]) is not None
-            else size
-            for char in set(text)
-            if (size := font.getsize(char))
-        }
+        if (glyphs := SpotifyClient._glyph_metrics.get(font)) is None:
+            glyphs = SpotifyClient._glyph_metrics[font] = LRU(4096)
+
+        map_ = {}
+        for char in set(text):
+            if (metrics := glyphs.get(char)) is None:
+                # getsize is gone in Pillow 10, the advance and the bottom
+                # of the bbox are what it used to return.
+                width, height = int(font.getlength(char)), font.getbbox(char)[3]
+                glyphs[char] = metrics = (
+                    width,
+                    height,
+                    height - font.getmask(char).size[1],
+                    height,
+                )
+
+            map_[char] = metrics if with_vertical_metrics else metrics[:2]
+
+        return map_  # type: ignore
+
+    @staticmethod
+    def _get_text_width(
+        text: str, map_: typing.Mapping[str, typing.Tuple[int, ...]]
+    ) -> int:
+        """Returns the width of the text by summing up the glyph widths in the map."""
+        return sum(map_[char][0] for char in text)
 
     @staticmethod
     def _get_height_from_text(
@@ -298,8 +514,6 @@ class SpotifyClient:
     ) -> typing.Tuple[Image.Image, typing.Optional[_SpotifyCardMetadata]]:
         metadata.album = f"on {metadata.album}"
 
-        title_width = self.C1_BOLD_FONT.getsize(metadata.title)[0]
-
         album_cover_size = 300
 
         height = raw_height = album_cover_size + self.SIDE_GAP * 3
@@ -307,12 +521,22 @@ class SpotifyClient:
         if hidden:
             height -= self.SIDE_GAP
 
-        rgbs, im = await self._get_album_and_colors(
-            metadata.album_cover_url, height, "downscale"
-        )
+        def measure() -> typing.Tuple[int, str, str]:
+            title_width = int(self.C1_BOLD_FONT.getlength(metadata.title))
+            width = max(title_width + raw_height, self.WIDTH)
+            text_area = width - raw_height
+            artist, album = [
+                self._shorten_text(self.BIG_FONT, i, text_area)
+                for i in (metadata.artists, metadata.album)
+            ]
+            return width, artist, album
 
-        width = (
-            width if (width := title_width + raw_height) > self.WIDTH else self.WIDTH
+        # the text only depends on the metadata, measure it while the cover is fetched.
+        (rgbs, im), (width, artist, album) = await asyncio.gather(
+            self._get_album_and_colors(
+                metadata.album_cover_url, album_cover_size, "downscale"
+            ),
+            self.bot.loop.run_in_executor(self.executor, measure),
         )
 
         def wrapper(
@@ -322,19 +546,12 @@ class SpotifyClient:
         ) -> typing.Tuple[Image.Image, typing.Optional[_SpotifyCardMetadata]]:
             canvas = Image.new("RGBA", (width, height), rgbs[0])
 
-            round_corners(im, self.SIDE_GAP)
-
-            im = im.resize((album_cover_size,) * 2)
+            # the cover is decoded straight to its final size, so scale
+            # the radius it used to be rounded with at the card height.
+            round_corners(im, self.SIDE_GAP * album_cover_size // height)
 
             canvas.paste(im, (self.SIDE_GAP,) * 2, im)
 
-            text_area = width - raw_height
-
-            artist, album = [
-                self._shorten_text(self.BIG_FONT, i, text_area)
-                for i in (metadata.artists, metadata.album)
-            ]
-
             font_color = self._get_font_color(*rgbs)  # type: ignore
 
             draw = ImageDraw.Draw(canvas)
@@ -397,7 +614,7 @@ class SpotifyClient:
             )
 
         return await self.bot.loop.run_in_executor(
-            self.bot.executor, wrapper, metadata, rgbs, im
+            self.executor, wrapper, metadata, rgbs, im
         )
 
     # pylint: disable=too-many-arguments,too-many-locals,too-many-statements
@@ -416,8 +633,23 @@ class SpotifyClient:
             width -= self.SIDE_GAP * 2
             height -= decrement
 
-        rgbs, im = await self._get_album_and_colors(
-            metadata.album_cover_url, height, "top-bottom blur"
+        text_area = width - height - self.SIDE_GAP * 2
+
+        def measure() -> typing.List[str]:
+            return [
+                self._shorten_text(f, t, text_area)
+                for f, t in (
+                    (self.C2_BOLD_FONT, metadata.title),
+                    (self.BIG_FONT, metadata.artists),
+                )
+            ]
+
+        # the text only depends on the metadata, measure it while the cover is fetched.
+        (rgbs, im), (title, artist) = await asyncio.gather(
+            self._get_album_and_colors(
+                metadata.album_cover_url, height, "top-bottom blur"
+            ),
+            self.bot.loop.run_in_executor(self.executor, measure),
         )
 
         def wrapper(
@@ -429,24 +661,24 @@ class SpotifyClient:
 
             delta = self.WIDTH - width
 
-            canvas_fade = right_fade(
-                canvas.crop((0, 0, height, height)),
-                int(base_rad - (delta / self.SIDE_GAP / 2)),
-            )
-
-            canvas.paste(im, (width - height, 0), im)
-
-            canvas.paste(canvas_fade, (width - height, 0), canvas_fade)
+            cover = im
+            # the cover may be a transparent avatar, flatten it onto
+            # the background color so it doesn't punch holes in the card.
+            if cover.getextrema()[3][0] < 255:
+                cover = Image.alpha_composite(
+                    Image.new("RGBA", cover.size, rgbs[0]), cover
+                )
 
-            text_area = width - height - self.SIDE_GAP * 2
+            # fade the background color into the cover first, this only
+            # touches the fade band, the rest of the cover is left as is.
+            cover.paste(
+                rgbs[0],
+                (0, 0),
+                get_fade_mask(cover.size, int(base_rad - (delta / self.SIDE_GAP / 2))),
+            )
 
-            title, artist = [
-                self._shorten_text(f, t, text_area)
-                for f, t in (
-                    (self.C2_BOLD_FONT, metadata.title),
-                    (self.BIG_FONT, metadata.artists),
-                )
-            ]
+            # the cover is opaque by now, so it's copied without blending.
+            canvas.paste(cover, (width - height, 0))
 
             font_color = self._get_font_color(*rgbs)
 
@@ -459,13 +691,7 @@ class SpotifyClient:
                 alt_color, key=get_luminance, reverse=bool(get_luminance(rgbs[0]) > 128)
             )
 
-            data = numpy.array(Image.open("nokari/assets/media/Spotify-50px.png"))
-
-            data[..., :-1][data[..., -1] > 0] = lighter_color
-
-            spotify_logo = Image.fromarray(data)
-
-            canvas.paste(spotify_logo, (self.SIDE_GAP,) * 2, spotify_logo)
+            canvas.paste(lighter_color, (self.SIDE_GAP,) * 2, self.SPOTIFY_LOGO_MASK)
 
             draw = ImageDraw.Draw(canvas)
 
@@ -476,9 +702,7 @@ class SpotifyClient:
             )
 
             # pylint: disable=unsubscriptable-object
-            spotify_width = sum(
-                [spotify_album_c_mapping[char][0] for char in spotify_text]
-            )
+            spotify_width = self._get_text_width(spotify_text, spotify_album_c_mapping)
 
             album_x = decrement + spotify_width + spotify_album_c_mapping[" "][0]
 
@@ -489,12 +713,8 @@ class SpotifyClient:
                     text_area - album_x - decrement + self.SIDE_GAP * 3,
                 )
 
-            draw.text(
-                (decrement, self.SIDE_GAP),
-                spotify_text,
-                font=self.SMALL_FONT,
-                fill=lighter_color,
-            )
+            spotify_text_mask = self._get_text_mask(spotify_text, self.SMALL_FONT)
+            canvas.paste(lighter_color, (decrement, self.SIDE_GAP), spotify_text_mask)
             draw.text(
                 (
                     album_x,
@@ -505,8 +725,8 @@ class SpotifyClient:
                 fill=alt_color,
             )
 
-            title_h = draw.textsize(title, font=self.C2_BOLD_FONT)[1]
-            artist_h = draw.textsize(artist, font=self.BIG_FONT)[1]
+            title_h = self.C2_BOLD_FONT.getbbox(title)[3]
+            artist_h = self.BIG_FONT.getbbox(artist)[3]
 
             outer_gap = (
                 raw_height
@@ -558,23 +778,37 @@ class SpotifyClient:
                 timestamp=metadata.timestamp,
             )
 
-        return await self.bot.loop.run_in_executor(self.bot.executor, wrapper, metadata)
+        return await self.bot.loop.run_in_executor(self.executor, wrapper, metadata)
 
-    @caches.cache(100)
     @staticmethod
-    def _shorten_text(font: ImageFont, text: str, threshold: int) -> str:
-        width, _ = font.getsize(text)
-        dot, _ = font.getsize("...")
-        if width < threshold:
+    def _shorten_text(font: ImageFont.FreeTypeFont, text: str, threshold: int) -> str:
+        key = (font.path, font.size, text, threshold)
+        if (shortened := SpotifyClient.text_cache.get(key)) is None:
+            shortened = SpotifyClient._do_shorten_text(font, text, threshold)
+            SpotifyClient.text_cache[key] = shortened
+
+        return shortened
+
+    @staticmethod
+    def _do_shorten_text(
+        font: ImageFont.FreeTypeFont, text: str, threshold: int
+    ) -> str:
+        if font.getlength(text) < threshold:
             return text
 
-        while width + dot > threshold:
-            text = text[:-1]
-            width = font.getsize(text)[0]
+        threshold -= int(font.getlength("..."))
 
-        return text + "..."
+        # the width only grows with the prefix, so binary search
+        # for the longest one that fits instead of peeling chars off.
+        lo, hi = 0, len(text) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if font.getlength(text[:mid]) <= threshold:
+                lo = mid
+            else:
+                hi = mid - 1
 
-    text_cache = _shorten_text.cache  # type: ignore
+        return text[:lo] + "..."
 
     def _get_data(self, data: typing.Union[hikari.User, Track]) -> SongMetadata:
         timestamp = None
@@ -604,9 +838,8 @@ class SpotifyClient:
         hidden: bool,
         style: str = "2",
     ) -> None:
-        func = f"_generate_base_card{style}"
         metadata = self._get_data(data)
-        canvas, card_data = await getattr(self, func)(metadata, hidden)
+        canvas, card_data = await self._card_generators[style](self, metadata, hidden)
 
         if card_data is not None:
 
@@ -631,7 +864,8 @@ class SpotifyClient:
                     coord = [(rectangle_length, y), (width, height)]
                     draw.rectangle(coord, fill=alt_color)
 
-                    w, h = draw.textsize(timestamp[1], font=self.SMALL_FONT)
+                    w = int(self.SMALL_FONT.getlength(timestamp[1]))
+                    h = self.SMALL_FONT.getbbox(timestamp[1])[3]
 
                     y -= text_gap + h
 
@@ -650,26 +884,26 @@ class SpotifyClient:
                     )
                 else:
                     rectangle_length = timestamp[2] / 100 * (width - 100)
-                    elapsed_bar = self._generate_rounded_rectangle(
-                        (width - self.SIDE_GAP * 2, text_gap),
-                        self.SIDE_GAP // 10,
-                        (*alt_color, 255),
-                    ).crop((0, 0, int(rectangle_length), 10))
-                    total_bar = self._generate_rounded_rectangle(
-                        (width - self.SIDE_GAP * 2, text_gap),
-                        self.SIDE_GAP // 10,
+                    bar_width = width - self.SIDE_GAP * 2
+                    x0 = self.SIDE_GAP
+                    y0 = height - self.SIDE_GAP * 2 - self.SIDE_GAP // 2
+                    rad = self.SIDE_GAP // 10
+
+                    # paste the color through the bar masks rather than
+                    # building full-width RGBA bars just to crop and paste them.
+                    canvas.paste(
                         (*alt_color, 150),
+                        (x0, y0),
+                        self._generate_bar_mask((bar_width, text_gap), rad, 150),
                     )
 
-                    # pylint: disable=blacklisted-name
-                    for bar in (total_bar, elapsed_bar):
+                    if elapsed := int(rectangle_length):
                         canvas.paste(
-                            bar,
-                            (
-                                self.SIDE_GAP,
-                                height - self.SIDE_GAP * 2 - self.SIDE_GAP // 2,
-                            ),
-                            bar,
+                            (*alt_color, 255),
+                            (x0, y0),
+                            self._generate_bar_mask(
+                                (bar_width, text_gap), rad, 255
+                            ).crop((0, 0, elapsed, text_gap)),
                         )
 
                     r = int(self.SIDE_GAP * 0.3)
@@ -685,7 +919,7 @@ class SpotifyClient:
                         font=self.SMALL_FONT,
                         fill=alt_color,
                     )
-                    w, _ = draw.textsize(timestamp[1], font=self.SMALL_FONT)
+                    w = int(self.SMALL_FONT.getlength(timestamp[1]))
                     draw.text(
                         (width - w - self.SIDE_GAP, height - self.SIDE_GAP * 2),
                         timestamp[1],
@@ -695,16 +929,18 @@ class SpotifyClient:
 
                 return canvas
 
-            canvas = await self.bot.loop.run_in_executor(self.bot.executor, wrapper)
+            canvas = await self.bot.loop.run_in_executor(self.executor, wrapper)
 
         def save() -> None:
-            canvas.save(buffer, "PNG")
+            canvas.save(buffer, "PNG", compress_level=1)
             buffer.seek(0)
 
-        await self.bot.loop.run_in_executor(self.bot.executor, save)
+        await self.bot.loop.run_in_executor(self.executor, save)
 
     __call__ = generate_spotify_card
 
+    _card_generators = {"1": _generate_base_card1, "2": _generate_base_card2}
+
     @typing.overload
     def _get_spotify_act(
         self, user: hikari.User, raise_if_none: typing.Literal[True] = True
@@ -745,10 +981,14 @@ class SpotifyClient:
     ) -> typing.Tuple[int, ...]:
         """Gets the font color."""
         base_y = get_luminance(base)
-        for rgb in seq:
-            y = get_luminance(rgb)
-            if abs(base_y - y) >= 108:
-                return tuple(rgb)
+        if seq:
+            contrasts = (
+                numpy.abs(numpy.asarray(seq)[:, :3] @ _LUMINANCE_WEIGHTS - base_y)
+                >= 108
+            )
+            # the first color that stands out enough from the base.
+            if contrasts.any():
+                return tuple(seq[int(contrasts.argmax())])
 
         return (255, 255, 255) if base_y < 128 else (0, 0, 0)
 
@@ -770,11 +1010,13 @@ class SpotifyClient:
 
     # pylint: disable=redefined-builtin
     def _get_id(self, type: str, query: str) -> str:
-        if self.rest.spotipy._is_uri(query):
-            return self.rest.spotipy._get_id(type, query)
-
-        if (match := SPOTIFY_URL.match(query)) and (id := match.groupdict()["id"]):
-            return id
+        # plain names are far more common than links, don't run the regexes on them.
+        if (
+            "spotify" in query
+            and (match := _match_spotify_uri(query) or _match_spotify_url(query))
+            is not None
+        ):
+            return match.group("id")
 
         raise RuntimeError("Couldn't resolve ID")
 
@@ -792,25 +1034,103 @@ class SpotifyClient:
         else:
             return self.get_item_from_id(id, type)
 
+    @caches.coalesce
     async def get_item_from_id(self, _id: str, /, type: typing.Type[T]) -> T:
-        item = getattr(self.cache, type.type + "s").get(_id)
+        item = self.cache.get_container(type.type).get(_id)
 
         if item:
             return item
 
-        res = await getattr(self.rest, type.type)(_id)
+        not_found_key = f"{type.type}:{_id}"
+        if self.cache.is_not_found(not_found_key):
+            raise SpotifyRestError(404, f"Couldn't find {type.type} {_id}")
+
+        try:
+            if type.type in _BATCHED_LOOKUPS:
+                res = await self._lookup_batched(type.type, _id)
+            else:
+                # albums are the only type left, their tracks need to be paginated.
+                res = await self.rest.album(_id)
+        except SpotifyRestError as e:
+            # 400 is what Spotify responds with for malformed IDs.
+            if e.status in (400, 404):
+                self.cache.set_not_found(not_found_key)
+
+            raise
+
         item = self.cache.set_item(type.from_dict(self, res))
         return item
 
+    def _lookup_batched(
+        self, type_name: str, _id: str
+    ) -> asyncio.Future[typing.Dict[str, typing.Any]]:
+        """Queues the ID so it gets fetched along with the other
+        lookups of the same type that are made in the meantime.
+        """
+        pending = self._pending_lookups.get(type_name)
+
+        if pending is None:
+            pending = self._pending_lookups[type_name] = {}
+            self.create_task(self._flush_lookups(type_name))
+
+        if (fut := pending.get(_id)) is None:
+            fut = pending[_id] = asyncio.get_running_loop().create_future()
+
+        return fut
+
+    async def _flush_lookups(self, type_name: str) -> None:
+        await asyncio.sleep(0.01)
+        pending = self._pending_lookups.pop(type_name)
+        method, limit = _BATCHED_LOOKUPS[type_name]
+        ids = list(pending)
+
+        async def fetch(chunk: typing.List[str]) -> None:
+            try:
+                raw_items = (await getattr(self.rest, method)(chunk))[method]
+            except Exception as e:  # pylint: disable=broad-except
+                for id in chunk:
+                    if not (fut := pending[id]).done():
+                        fut.set_exception(e)
+                return
+
+            for id, raw in zip(chunk, raw_items):
+                if (fut := pending[id]).done():
+                    continue
+
+                # invalid IDs are returned as null instead of failing the request.
+                if raw is None:
+                    fut.set_exception(
+                        SpotifyRestError(404, f"Couldn't find {type_name} {id}")
+                    )
+                else:
+                    fut.set_result(raw)
+
+            # zip stops at the shorter one, don't leave the rest waiting forever.
+            for id in chunk[len(raw_items) :]:
+                if not (fut := pending[id]).done():
+                    fut.set_exception(
+                        SpotifyRestError(500, f"Spotify didn't return {type_name} {id}")
+                    )
+
+        await asyncio.gather(
+            *(fetch(ids[i : i + limit]) for i in range(0, len(ids), limit))
+        )
+
+    @caches.coalesce
     async def search(self, q: str, /, type: typing.Type[T]) -> typing.List[T]:
         plural = type.type + "s"
         queries = self.cache.get_queries(type.type)
         q = q.lower()
+        not_found_key = f"{type.type}?{q}"
+
+        if self.cache.is_not_found(not_found_key):
+            return []
+
         ids = queries.get(q)
 
         if ids is not None:
             items: typing.List[T] = []
-            item_cache = getattr(self.cache, plural)
+            item_cache = self.cache.get_container(type.type)
             for id in ids:
                 item = item_cache.get(id)
 
@@ -823,16 +1143,20 @@ class SpotifyClient:
 
         res = await self.rest.search(q, 10, 0, type.type, None)
         raw_items = res[plural]["items"]
+
+        if not raw_items:
+            # don't keep empty results around for long, the index may catch up.
+            self.cache.set_not_found(not_found_key)
+            return []
+
         queries[q] = ids = [item["id"] for item in raw_items]
 
         if type is Album:
-            if not ids:
-                return []
-
             res = await self.rest.albums(ids)
             raw_items = res[plural]
 
-        items = [type.from_dict(self, item) for item in raw_items]
+        from_dict = type.from_dict
+        items = [from_dict(self, item) for item in raw_items]
         self.cache.update_items(items)
         return items
 
@@ -866,48 +1190,59 @@ class SpotifyClient:
         title: typing.Tuple[str, str],
         format: str,
     ) -> typing.Optional[T]:
-        if not (length := len(seq)):
+        if (length := len(seq)) == 1:
+            return seq[0]
+
+        if not length:
             await ctx.respond(title[1])
             return None
 
-        if length == 1:
-            return seq[0]
-
         custom_id = f"{int(time.time())}-select-spotify-item"
-        shorten = partial(textwrap.shorten, width=100, placeholder="...")
+        render = _compile_format(format)
+        labels = [
+            textwrap.shorten(f"{idx}. {render(item)}", 100, placeholder="...")
+            for idx, item in enumerate(seq, start=1)
+        ]
         menu = (
             self.bot.rest.build_action_row()
             .add_select_menu(custom_id)
             .set_min_values(1)
             .set_max_values(1)
-            .set_placeholder(shorten(f"1. {format.format(item=seq[0])}"))
+            .set_placeholder(labels[0])
         )
 
-        for idx, item in enumerate(seq, start=1):
-            menu.add_option(
-                shorten(f"{idx}. {format.format(item=item)}"), str(idx - 1)
-            ).add_to_menu()
+        for idx, label in enumerate(labels):
+            menu.add_option(label, str(idx)).add_to_menu()
 
         msg: hikari.Message
         maybe_msg = await ctx.respond(
-            content=title[not seq], component=menu.add_to_container()
+            content=title[0], component=menu.add_to_container()
         )
         if not maybe_msg:
             msg = await ctx.interaction.fetch_initial_response()
         else:
             msg = maybe_msg
 
+        # the predicate runs for every interaction within the timeout,
+        # so the IDs are bound as defaults rather than looked up each time.
+        def predicate(
+            e: hikari.InteractionCreateEvent,
+            message_id: hikari.Snowflake = msg.id,
+            user_id: hikari.Snowflake = ctx.interaction.user.id,
+            channel_id: hikari.Snowflake = ctx.interaction.channel_id,
+        ) -> bool:
+            interaction = e.interaction
+            return (
+                isinstance(interaction, hikari.ComponentInteraction)
+                and interaction.custom_id == custom_id
+                and interaction.message.id == message_id
+                and interaction.user.id == user_id
+                and interaction.channel_id == channel_id
+            )
+
         with suppress(asyncio.TimeoutError):
             event = await self.bot.wait_for(
-                hikari.InteractionCreateEvent,
-                predicate=lambda e: isinstance(
-                    e.interaction, hikari.ComponentInteraction
-                )
-                and e.interaction.message.id == msg.id
-                and e.interaction.user.id == ctx.interaction.user.id
-                and e.interaction.channel_id == ctx.interaction.channel_id
-                and e.interaction.custom_id == custom_id,
-                timeout=60,
+                hikari.InteractionCreateEvent, predicate=predicate, timeout=60
             )
             assert isinstance(event.interaction, hikari.ComponentInteraction)
             ctx.component_interaction = interaction = event.interaction
@@ -916,20 +1251,42 @@ class SpotifyClient:
             )
             return seq[int(interaction.values[0])]
 
-        await msg.delete()
+        # nobody waits on the cleanup, so don't hold the caller up for it.
+        asyncio.create_task(msg.delete()).add_done_callback(_log_task_exception)
         return None
 
+    @caches.coalesce
     async def get_audio_features(self, _id: str) -> AudioFeatures:
         audio_features = self.cache.audio_features.get(_id)
 
         if audio_features:
             return audio_features
 
-        res = (await self.rest.audio_features([_id]))[0]
+        not_found_key = f"audio_features:{_id}"
+        if self.cache.is_not_found(not_found_key):
+            raise SpotifyRestError(404, f"Couldn't find audio_features {_id}")
+
+        try:
+            res = await self._lookup_batched("audio_features", _id)
+        except SpotifyRestError as e:
+            if e.status in (400, 404):
+                self.cache.set_not_found(not_found_key)
+
+            raise
+
         audio_features = AudioFeatures.from_dict(self, res)
         self.cache.set_item(audio_features)
         return audio_features
 
+    async def get_multiple_audio_features(
+        self, tracks: typing.Sequence[SimplifiedTrack]
+    ) -> typing.List[AudioFeatures]:
+        """Gets the audio features of the tracks in as few requests as possible."""
+        return await asyncio.gather(
+            *[self.get_audio_features(track.id) for track in tracks]
+        )
+
+    @caches.coalesce
     async def get_top_tracks(
         self, artist_id: str, country: str = "US"
     ) -> typing.List[Track]:
@@ -948,7 +1305,8 @@ class SpotifyClient:
                 return top_tracks
 
         res = await self.rest.artist_top_tracks(artist_id, country)
-        top_tracks = [Track.from_dict(self, track) for track in res["tracks"]]
+        from_dict = Track.from_dict
+        top_tracks = [from_dict(self, track) for track in res["tracks"]]
         self.cache.update_items(top_tracks)
         self.cache.top_tracks[artist_id] = [track.id for track in top_tracks]
         return top_tracks
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 import typing
 
 from lru import LRU  # pylint: disable=no-name-in-module
@@ -10,6 +11,11 @@ if typing.TYPE_CHECKING:
 
 
 class SpotifyCache:
+    # one attribute per item type, plus the state of the clear loop.
+    # pylint: disable=too-many-instance-attributes
+
+    NOT_FOUND_TTL = 60
+
     def __init__(self) -> None:
         self._tracks = LRU(50)
         self._artists = LRU(50)
@@ -19,14 +25,47 @@ class SpotifyCache:
         self._queries: typing.Dict[str, LRU] = {
             i: LRU(50) for i in ("artist", "track", "album")
         }
+        # key -> monotonic time the "not found" result expires at.
+        self._not_found: LRU = LRU(100)
+        self._containers: typing.Dict[str, LRU] = {
+            "track": self._tracks,
+            "artist": self._artists,
+            "album": self._albums,
+            "audio_features": self._audio_features,
+        }
+        # the cache is shared between clients, only the last one
+        # to close it gets to stop the clear loop.
+        self._users = 0
+        self._stop = asyncio.Event()
         self._task: asyncio.Task[None] = asyncio.create_task(self.start_clear_loop())
 
-    def __del__(self) -> None:
-        self._task.cancel()
+    def start(self) -> None:
+        """Registers a user of the cache, and restarts the clear loop
+        in the running loop if it's been stopped. The cached items are kept.
+        """
+        self._users += 1
+
+        # a pending close may not have stopped the loop yet, but it will.
+        if self._stop.is_set() or self._task.done():
+            # the event is bound to the loop it was created in as well.
+            self._stop = asyncio.Event()
+            self._task = asyncio.create_task(self.start_clear_loop())
+
+    async def close(self) -> None:
+        """Unregisters a user of the cache, and stops the clear loop
+        if there are none left. The cached items are kept.
+        """
+        self._users -= 1
+        if self._users > 0:
+            return
+
+        stop, task = self._stop, self._task
+        stop.set()
+        await task
 
     # pylint: disable=redefined-builtin
     def get_container(self, type: str) -> LRU:
-        return getattr(self, f"{type}{'s'*(not type.endswith('s'))}")
+        return self._containers[type]
 
     def update_items(self, items: typing.Sequence[BaseSpotify]) -> None:
         if not items:
@@ -74,12 +113,30 @@ class SpotifyCache:
     def get_queries(self, type_name: str) -> LRU:
         return self._queries[type_name]
 
+    def is_not_found(self, key: str) -> bool:
+        if (expires_at := self._not_found.get(key)) is None:
+            return False
+
+        if expires_at > time.monotonic():
+            return True
+
+        del self._not_found[key]
+        return False
+
+    def set_not_found(self, key: str) -> None:
+        self._not_found[key] = time.monotonic() + self.NOT_FOUND_TTL
+
     async def start_clear_loop(self) -> None:
-        while 1:
-            await asyncio.sleep(86400)
-            self._tracks.clear()
-            self._artists.clear()
-            self._audio_features.clear()
-            self._top_tracks.clear()
-            self._albums.clear()
-            _ = [i.clear() for i in self._queries.values()]
+        # bound once, start() replaces the event for the loop that succeeds this one.
+        stop = self._stop
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), 86400)
+            except asyncio.TimeoutError:
+                self._tracks.clear()
+                self._artists.clear()
+                self._audio_features.clear()
+                self._top_tracks.clear()
+                self._albums.clear()
+                self._not_found.clear()
+                _ = [i.clear() for i in self._queries.values()]
@@ -4,3 +4,12 @@ class NoSpotifyPresenceError(Exception):
 
 class LocalFilesDetected(Exception):
     """Raised when the member is listening to local files on Spotify."""
+
+
+class SpotifyRestError(Exception):
+    """Raised when the Spotify Web API responds with an error."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
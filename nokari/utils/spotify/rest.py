@@ -1,33 +1,211 @@
 import asyncio
+import os
+import time
 import typing
-from functools import partial
 
-import spotipy
+import aiohttp
+
+from .errors import SpotifyRestError
+
+API_URL = "https://api.spotify.com/v1"
+TOKEN_URL = "https://accounts.spotify.com/api/token"
+_Params = typing.Dict[str, typing.Any]
+# same as spotipy, which this replaced.
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+MAX_RETRIES = 3
+MAX_RETRY_AFTER = 30
 
 
 class SpotifyRest:
+    """A thin async wrapper around the Spotify Web API using client credentials."""
+
     def __init__(
         self,
         *,
-        executor: typing.Any = None,
+        client_id: typing.Optional[str] = None,
+        client_secret: typing.Optional[str] = None,
     ) -> None:
-        self.spotipy = spotipy.Spotify(auth_manager=spotipy.SpotifyClientCredentials())
-        self._loop = asyncio.get_running_loop()
-        self._executor = executor
+        self._auth = aiohttp.BasicAuth(
+            client_id or os.environ["SPOTIPY_CLIENT_ID"],
+            client_secret or os.environ["SPOTIPY_CLIENT_SECRET"],
+        )
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+        self._token: typing.Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Returns the session, it's created lazily so it binds to the running loop."""
+        if self._session is None or self._session.closed:
+            # every request goes to the same couple of hosts,
+            # so keep the connections around for reuse.
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32, limit_per_host=8, keepalive_timeout=60, ttl_dns_cache=300
+                )
+            )
+
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def warm_up(self) -> None:
+        """Fetches a token, which also opens a connection to Spotify."""
+        await self._get_token()
+
+    async def _get_token(self) -> str:
+        if self._token is not None and time.monotonic() < self._token_expires_at:
+            return self._token
+
+        async with self._token_lock:
+            # whoever held the lock may have refreshed it already.
+            if self._token is not None and time.monotonic() < self._token_expires_at:
+                return self._token
+
+            return await self._refresh_token()
+
+    async def _refresh_token(self) -> str:
+        async with self.session.post(
+            TOKEN_URL, data={"grant_type": "client_credentials"}, auth=self._auth
+        ) as resp:
+            if resp.status != 200:
+                raise SpotifyRestError(resp.status, await self._read_error(resp))
+
+            data = await resp.json()
+
+        self._token = data["access_token"]
+        # refresh a minute early so in-flight requests don't use an expired token.
+        self._token_expires_at = time.monotonic() + data["expires_in"] - 60
+        return self._token
+
+    async def request(
+        self, url: str, params: typing.Optional[_Params] = None
+    ) -> typing.Dict[str, typing.Any]:
+        """Makes a GET request, url may either be a path or a full URL, e.g. a `next` URL."""
+        if not url.startswith("https://"):
+            url = f"{API_URL}/{url}"
+
+        params = params and {
+            k: ",".join(v) if isinstance(v, list) else v
+            for k, v in params.items()
+            if v is not None
+        }
+
+        retries = 0
+        token_refreshed = False
+        while True:
+            token = await self._get_token()
+            headers = {"Authorization": f"Bearer {token}"}
+            async with self.session.get(url, params=params, headers=headers) as resp:
+                if resp.status == 200 and resp.content_type == "application/json":
+                    return await resp.json()
+
+                status = resp.status
+                retry_after = resp.headers.get("Retry-After")
+                message = await self._read_error(resp)
+
+            # retry once on 401, the token may have been revoked before it expired.
+            if status == 401 and not token_refreshed:
+                token_refreshed = True
+                # concurrent requests may have refreshed it already.
+                if self._token == token:
+                    self._token = None
 
-    def __getattr__(self, attr: str) -> partial[typing.Awaitable[typing.Any]]:
-        return partial(
-            self._loop.run_in_executor, self._executor, getattr(self.spotipy, attr)
+                continue
+
+            if (
+                status in RETRY_STATUSES
+                and retries < MAX_RETRIES
+                and (delay := self._get_retry_delay(retry_after, retries)) is not None
+            ):
+                retries += 1
+                await asyncio.sleep(delay)
+                continue
+
+            raise SpotifyRestError(status, message)
+
+    @staticmethod
+    def _get_retry_delay(
+        retry_after: typing.Optional[str], retries: int
+    ) -> typing.Optional[float]:
+        """Returns how long to wait before retrying, or None if it's not worth waiting for."""
+        if retry_after is None or not retry_after.isdigit():
+            return 0.5 * 2 ** retries
+
+        # rate limits can last for hours, fail the command rather than hang it.
+        if (delay := int(retry_after)) > MAX_RETRY_AFTER:
+            return None
+
+        return delay
+
+    @staticmethod
+    async def _read_error(resp: aiohttp.ClientResponse) -> str:
+        # errors from the edge come as plain text or HTML rather than JSON.
+        if resp.content_type != "application/json":
+            return await resp.text()
+
+        data = await resp.json()
+        error = data.get("error")
+        if isinstance(error, dict):
+            return error.get("message", str(error))
+
+        # the token endpoint uses the OAuth error format.
+        return data.get("error_description") or str(error)
+
+    async def track(self, track_id: str) -> typing.Dict[str, typing.Any]:
+        return await self.request(f"tracks/{track_id}")
+
+    async def tracks(self, track_ids: typing.List[str]) -> typing.Dict[str, typing.Any]:
+        return await self.request("tracks", {"ids": track_ids})
+
+    async def artist(self, artist_id: str) -> typing.Dict[str, typing.Any]:
+        return await self.request(f"artists/{artist_id}")
+
+    async def artists(
+        self, artist_ids: typing.List[str]
+    ) -> typing.Dict[str, typing.Any]:
+        return await self.request("artists", {"ids": artist_ids})
+
+    async def artist_top_tracks(
+        self, artist_id: str, country: str = "US"
+    ) -> typing.Dict[str, typing.Any]:
+        return await self.request(
+            f"artists/{artist_id}/top-tracks", {"country": country}
         )
 
     # pylint: disable=redefined-builtin
     async def album(self, album_id: str) -> typing.Dict[str, typing.Any]:
-        res = await self.__getattr__("album")(album_id)
+        res = await self.request(f"albums/{album_id}")
         next = res["tracks"]["next"]
 
         while next:
-            ext = await self.__getattr__("_get")(next)
+            ext = await self.request(next)
             res["tracks"]["items"].extend(ext["items"])
             next = ext["next"]
 
         return res
+
+    async def albums(self, album_ids: typing.List[str]) -> typing.Dict[str, typing.Any]:
+        return await self.request("albums", {"ids": album_ids})
+
+    async def audio_features(
+        self, track_ids: typing.List[str]
+    ) -> typing.Dict[str, typing.Any]:
+        return await self.request("audio-features", {"ids": track_ids})
+
+    async def search(
+        self,
+        q: str,
+        limit: int = 10,
+        offset: int = 0,
+        type: str = "track",
+        market: typing.Optional[str] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        return await self.request(
+            "search",
+            {"q": q, "limit": limit, "offset": offset, "type": type, "market": market},
+        )
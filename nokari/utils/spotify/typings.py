@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime
-import re
 import typing
 from dataclasses import dataclass
 
@@ -51,12 +50,124 @@ class Camelot(metaclass=_CamelotType):
     """The actual Camelot class."""
 
 
+_Converter = typing.Callable[["SpotifyClient", typing.Any], typing.Any]
+
+
+def _convert_artists(
+    client: SpotifyClient, artists: typing.List[typing.Dict[str, typing.Any]]
+) -> typing.List[SimplifiedArtist]:
+    return [SimplifiedArtist.from_dict(client, artist) for artist in artists]
+
+
+def _convert_album(
+    client: SpotifyClient, album: typing.Dict[str, typing.Any]
+) -> SimplifiedAlbum:
+    return SimplifiedAlbum.from_dict(client, album)
+
+
+def _convert_release_date(_: SpotifyClient, release_date: str) -> datetime.datetime:
+    # we couldn't really rely on "release_date_precision"
+    # since it's optional, so we're just gonna check it on our own.
+    # the length is enough to tell YYYY, YYYY-MM, and YYYY-MM-DD apart.
+    try:
+        if (length := len(release_date)) == 10:
+            date = datetime.datetime.fromisoformat(release_date)
+        elif length == 7:
+            date = datetime.datetime(int(release_date[:4]), int(release_date[5:]), 1)
+        elif length == 4:
+            date = datetime.datetime(int(release_date), 1, 1)
+        else:
+            raise ValueError
+    except ValueError:
+        raise RuntimeError(f"Unable to parse release_date: {release_date}") from None
+
+    return date.replace(tzinfo=pytz.UTC)
+
+
+def _convert_copyrights(
+    _: SpotifyClient, copyrights: typing.List[typing.Dict[str, str]]
+) -> Copyrights:
+    # YIIIKKKKEEESSS
+    mapping = {
+        "C": ("Copyright", "\N{COPYRIGHT SIGN} "),
+        "P": ("Phonogram", "\N{SOUND RECORDING COPYRIGHT} "),
+    }
+    return typing.cast(
+        Copyrights,
+        {
+            cp[0]: cp[1]
+            + c["text"].replace(f"({_type})", "").replace(cp[1], "").strip()
+            for c in copyrights
+            if (_type := c["type"]) and (cp := mapping[_type])
+        },
+    )
+
+
+def _convert_tracks(
+    client: SpotifyClient, tracks: typing.Dict[str, typing.Any]
+) -> typing.List[SimplifiedTrack]:
+    return [SimplifiedTrack.from_dict(client, track) for track in tracks["items"]]
+
+
+def _convert_external_urls(
+    _: SpotifyClient, external_urls: typing.Dict[str, str]
+) -> str:
+    return external_urls["spotify"]
+
+
+def _convert_images(
+    _: SpotifyClient, images: typing.List[typing.Dict[str, typing.Any]]
+) -> str:
+    return images[0]["url"] if images else ""
+
+
+def _convert_followers(
+    _: SpotifyClient, followers: typing.Dict[str, typing.Any]
+) -> int:
+    return followers["total"]
+
+
+# payload key -> (field name, converter) for the fields that
+# need converting, anything else is passed as is.
+_CONVERTERS: typing.Dict[str, typing.Tuple[str, _Converter]] = {
+    "artists": ("artists", _convert_artists),
+    "album": ("album", _convert_album),
+    "release_date": ("release_date", _convert_release_date),
+    "copyrights": ("copyrights", _convert_copyrights),
+    "tracks": ("tracks", _convert_tracks),
+    "external_urls": ("url", _convert_external_urls),
+    "images": ("cover_url", _convert_images),
+    "followers": ("follower_count", _convert_followers),
+}
+
+
 @dataclass()
 class BaseSpotify:
     client: SpotifyClient
     id: str
     type: typing.ClassVar[str] = "base"
     uri: str
+    _fields: typing.ClassVar[typing.FrozenSet[str]] = frozenset()
+    _converters: typing.ClassVar[
+        typing.Dict[str, typing.Tuple[str, typing.Optional[_Converter]]]
+    ] = {}
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # computed once per class rather than merging the annotations
+        # of the whole MRO on every from_dict call.
+        cls._fields = frozenset(
+            k
+            for parent in cls.__mro__
+            for k, v in getattr(parent, "__annotations__", {}).items()
+            if k != "client" and not str(v).startswith("typing.ClassVar")
+        )
+        converters = {k: v for k, v in _CONVERTERS.items() if v[0] in cls._fields}
+        derived = {name for name, _ in converters.values()}
+        cls._converters = {
+            **{k: (k, None) for k in cls._fields - derived},
+            **converters,
+        }
 
     @classmethod
     def from_dict(
@@ -64,33 +175,13 @@ class BaseSpotify:
         client: SpotifyClient,
         payload: typing.Dict[str, typing.Any],
     ) -> T:
-        merged_annotations = {
-            **cls.__annotations__,
-            **{
-                k: v
-                for parent in cls.__mro__
-                if hasattr(parent, "__annotations__")
-                for k, v in parent.__annotations__.items()
-            },
-        }
-
-        kwargs = convert_data(
-            client,
-            {k: v for k, v in payload.items() if k in merged_annotations},
-        )
-
-        if "url" in merged_annotations:
-            kwargs["url"] = payload["external_urls"]["spotify"]
-
-        if "cover_url" in merged_annotations and "images" in payload:
-            kwargs["cover_url"] = (
-                images[0]["url"] if (images := payload["images"]) else ""
-            )
-
-        if "follower_count" in merged_annotations and "followers" in payload:
-            kwargs["follower_count"] = payload["followers"]["total"]
-
-        kwargs.pop("type", None)
+        # a single lookup per payload key, unknown keys are dropped.
+        converters = cls._converters
+        kwargs: typing.Dict[str, typing.Any] = {}
+        for k, v in payload.items():
+            if (converter := converters.get(k)) is not None:
+                name, convert = converter
+                kwargs[name] = v if convert is None else convert(client, v)
 
         return cls(client, **kwargs)
 
@@ -176,10 +267,9 @@ class SimplifiedTrack(BaseSpotify, ArtistAware, SpotifyCodeable):
 
         return f"[{self.artists_str} - {self}]({self.url} '{self} on Spotify')"
 
-    def get_audio_features(
-        self,
-    ) -> typing.Coroutine[typing.Any, typing.Any, AudioFeatures]:
-        return self.client.get_audio_features(self.id)
+    async def get_audio_features(self) -> AudioFeatures:
+        # goes through the batch path so it shares requests with other lookups.
+        return (await self.client.get_multiple_audio_features([self]))[0]
 
 
 @dataclass()
@@ -272,57 +362,3 @@ class Spotify:
     @property
     def timestamps(self) -> typing.Optional[hikari.ActivityTimestamps]:
         return self._act.timestamps
-
-
-SPOTIFY_DATE = re.compile(r"(?P<Y>\d{4})(?:-(?P<m>\d{2})-(?P<d>\d{2}))?")
-
-
-def convert_data(
-    client: SpotifyClient, d: typing.Dict[str, typing.Any]
-) -> typing.Dict[str, typing.Any]:
-    for k, v in d.items():
-        if k == "artists":
-            d["artists"] = [
-                SimplifiedArtist.from_dict(client, artist) for artist in d["artists"]
-            ]
-
-        elif k == "album":
-            d["album"] = SimplifiedAlbum.from_dict(client, d["album"])
-
-        elif k == "release_date":
-            # we couldn't really rely on "release_date_precision"
-            # since it's optional, so we're just gonna check it on our own
-            match = SPOTIFY_DATE.match(v)
-
-            if not match:
-                raise RuntimeError(f"Unable to parse {k}: {v}")
-
-            pattern = "-".join([f"%{k}" for k, v in match.groupdict().items() if v])
-
-            d["release_date"] = datetime.datetime.strptime(v, pattern).replace(
-                tzinfo=pytz.UTC
-            )
-
-        elif k == "copyrights":
-            # YIIIKKKKEEESSS
-            mapping = {
-                "C": ("Copyright", "\N{COPYRIGHT SIGN} "),
-                "P": ("Phonogram", "\N{SOUND RECORDING COPYRIGHT} "),
-            }
-            d[k] = {
-                cp[0]: cp[1]
-                + c["text"].replace(f"({_type})", "").replace(cp[1], "").strip()
-                for c in v
-                if (_type := c["type"]) and (cp := mapping[_type])
-            }
-
-        elif k == "tracks":
-            d[k] = [
-                SimplifiedTrack.from_dict(client, track)
-                for track in d["tracks"]["items"]
-            ]
-
-        elif isinstance(v, dict):
-            d[k] = convert_data(client, d[k])
-
-    return d